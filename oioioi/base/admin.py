@@ -428,11 +428,20 @@ class MixinsAdmin(InstanceDependentAdmin):
                 'MixinsAdmin.default_model_admin must '
                 'be a subclass of ObjectWithMixins'
             )
+        self._mixed_model_admins = {}
 
     def _model_admin_for_instance(self, request, instance=None):
         mixins = self._mixins_for_instance(request, instance)
         if mixins:
-            return self.default_model_admin(self.model, self.admin_site, mixins=mixins)
+            # Creating a class with mixins and running all the mixins'
+            # __init__ methods is expensive, so there is only one model admin
+            # for every distinct set of mixins.
+            key = tuple(mixins)
+            if key not in self._mixed_model_admins:
+                self._mixed_model_admins[key] = self.default_model_admin(
+                    self.model, self.admin_site, mixins=mixins
+                )
+            return self._mixed_model_admins[key]
 
     def _mixins_for_instance(self, request, instance=None):
         raise NotImplementedError
@@ -25,9 +25,7 @@ from oioioi.contests.models import (
     RankingVisibilityConfig,
     Round,
     RoundTimeExtension,
-    ScoreReport,
     Submission,
-    SubmissionReport,
     UserResultForContest,
     UserResultForProblem,
     UserResultForRound,
@@ -76,12 +74,13 @@ def submission_template_context(request, submission):
     message = submission.get_status_display
 
     if can_see_score and (submission.status == 'INI_OK' or submission.status == 'OK'):
-        submission_report = SubmissionReport.objects.filter(
-            submission=submission
-        ).first()
-        score_report = ScoreReport.objects.filter(
-            submission_report=submission_report
-        ).first()
+        # Indexing (rather than .first()) lets callers avoid the queries
+        # by prefetching ``submissionreport_set__scorereport_set``.
+        try:
+            submission_report = submission.submissionreport_set.all()[0]
+        except IndexError:
+            submission_report = None
+        score_report = submission_report.score_report if submission_report else None
 
         try:
             score_percentage = (
@@ -811,7 +810,9 @@ class ContestController(RegisteredSubclassesBase, ObjectWithMixins):
         the user for the problems that are visible, except for admins, which
         get all their submissions.
 
-        Should return the updated queryset.
+        Should return the updated queryset. Implementations should narrow
+        it down with queryset filters instead of evaluating it, so that the
+        filtering is done by the database.
         """
         if not request.user.is_authenticated:
             return queryset.none()
@@ -929,6 +929,24 @@ class TestMultilingualStatements(TestCase, TestStreamingMixin):
         response = self.client.get(url)
         self.assertStreamingEqual(response, b'en-txt')
 
+    def test_statement_etag(self):
+        pi = ProblemInstance.objects.get()
+        url = reverse(
+            'problem_statement',
+            kwargs={'contest_id': pi.contest.id, 'problem_instance': pi.short_name},
+        )
+        response = self.client.get(url)
+        self.assertStreamingEqual(response, b'en-txt')
+        etag = response['ETag']
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        self.client.cookies['lang'] = 'pl'
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertStreamingEqual(response, b'pl-pdf')
+        self.assertNotEqual(response['ETag'], etag)
+
 
 class ContestWithoutStatementsController(ProgrammingContestController):
     def default_can_see_statement(self, request_or_context, problem_instance):
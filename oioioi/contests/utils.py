@@ -217,10 +217,8 @@ def has_any_visible_problem_instance(request):
 @request_cached
 def submittable_problem_instances(request):
     controller = request.contest.controller
-    queryset = (
-        ProblemInstance.objects.filter(contest=request.contest)
-        .select_related('problem')
-        .prefetch_related('round')
+    queryset = ProblemInstance.objects.filter(contest=request.contest).select_related(
+        'problem', 'contest', 'round'
     )
     return [pi for pi in queryset if controller.can_submit(request, pi)]
 
@@ -228,14 +226,20 @@ def submittable_problem_instances(request):
 @request_cached
 def visible_problem_instances(request):
     controller = request.contest.controller
-    queryset = (
-        ProblemInstance.objects.filter(contest=request.contest)
-        .select_related('problem')
-        .prefetch_related('round')
+    queryset = ProblemInstance.objects.filter(contest=request.contest).select_related(
+        'problem', 'contest', 'round'
     )
     return [pi for pi in queryset if controller.can_see_problem(request, pi)]
 
 
+@request_cached
+def visible_problem_ids(request):
+    """Returns ids of problems which have a visible problem instance
+    in the current contest.
+    """
+    return frozenset(pi.problem_id for pi in visible_problem_instances(request))
+
+
 @request_cached
 def visible_rounds(request):
     controller = request.contest.controller
@@ -350,7 +354,15 @@ def can_enter_contest(request):
 
 def get_submission_or_error(request, submission_id, submission_class=Submission):
     """Returns the submission if it exists and user has rights to see it."""
-    submission = get_object_or_404(submission_class, id=submission_id)
+    submission = get_object_or_404(
+        submission_class.objects.select_related(
+            'user',
+            'problem_instance',
+            'problem_instance__contest',
+            'problem_instance__problem',
+        ),
+        id=submission_id,
+    )
     if hasattr(request, 'user') and request.user.is_superuser:
         return submission
     pi = submission.problem_instance
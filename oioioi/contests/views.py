@@ -1,3 +1,4 @@
+import hashlib
 from operator import itemgetter  # pylint: disable=E0611
 
 import six
@@ -12,6 +13,8 @@ from django.http import HttpResponse, HttpResponseRedirect
 from django.shortcuts import get_object_or_404, redirect
 from django.template.response import TemplateResponse
 from django.urls import reverse
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
 from django.utils.safestring import mark_safe
 from django.utils.translation import gettext_lazy as _
 from django.utils.translation import ngettext_lazy
@@ -44,6 +47,7 @@ from oioioi.contests.utils import (
     is_contest_basicadmin,
     is_contest_observer,
     visible_contests,
+    visible_problem_ids,
     visible_problem_instances,
     visible_rounds,
 )
@@ -100,6 +104,29 @@ def problems_list_view(request):
     controller = request.contest.controller
     problem_instances = visible_problem_instances(request)
 
+    # Because this view can be accessed by an anynomous user we can't
+    # use `user=request.user` (it would cause TypeError). Surprisingly
+    # using request.user.id is ok since for AnynomousUser id is set
+    # to None.
+    user_results = {
+        r.problem_instance_id: r
+        for r in UserResultForProblem.objects.filter(
+            user__id=request.user.id, problem_instance__in=problem_instances
+        ).select_related('submission_report__submission')
+    }
+
+    def visible_result(pi):
+        r = user_results.get(pi.id)
+        if (
+            r
+            and r.submission_report
+            and controller.can_see_submission_score(
+                request, r.submission_report.submission
+            )
+        ):
+            return r
+        return None
+
     # Problem statements in order
     # 1) problem instance
     # 2) statement_visible
@@ -115,24 +142,7 @@ def problems_list_view(request):
                 pi,
                 controller.can_see_statement(request, pi),
                 controller.get_round_times(request, pi.round),
-                # Because this view can be accessed by an anynomous user we can't
-                # use `user=request.user` (it would cause TypeError). Surprisingly
-                # using request.user.id is ok since for AnynomousUser id is set
-                # to None.
-                next(
-                    (
-                        r
-                        for r in UserResultForProblem.objects.filter(
-                            user__id=request.user.id, problem_instance=pi
-                        )
-                        if r
-                        and r.submission_report
-                        and controller.can_see_submission_score(
-                            request, r.submission_report.submission
-                        )
-                    ),
-                    None,
-                ),
+                visible_result(pi),
                 pi.controller.get_submissions_left(request, pi),
                 pi.controller.get_submissions_limit(request, pi),
                 controller.can_submit(request, pi),
@@ -144,7 +154,9 @@ def problems_list_view(request):
 
     show_submissions_limit = any([p[5] for p in problems_statements])
     show_submit_button = any([p[6] for p in problems_statements])
-    show_rounds = len(frozenset(pi.round_id for pi in problem_instances)) > 1
+    round_ids = (pi.round_id for pi in problem_instances)
+    first_round_id = next(round_ids, None)
+    show_rounds = any(round_id != first_round_id for round_id in round_ids)
     table_columns = 3 + int(show_submissions_limit) + int(show_submit_button)
 
     return TemplateResponse(
@@ -166,7 +178,9 @@ def problems_list_view(request):
 def problem_statement_view(request, problem_instance):
     controller = request.contest.controller
     pi = get_object_or_404(
-        ProblemInstance, round__contest=request.contest, short_name=problem_instance
+        ProblemInstance.objects.select_related('problem'),
+        round__contest=request.contest,
+        short_name=problem_instance,
     )
 
     if not controller.can_see_problem(request, pi) or not controller.can_see_statement(
@@ -193,7 +207,16 @@ def problem_statement_view(request, problem_instance):
             problem_instance=problem_instance,
             statement_id=statement.id,
         )
-    return stream_file(statement.content, statement.download_name)
+
+    # Statements are immutable once uploaded (a new upload gets a new
+    # filetracker version), so the versioned name identifies the content.
+    versioned_name = statement.content.name.versioned_name
+    etag = quote_etag(hashlib.sha1(versioned_name.encode('utf-8')).hexdigest())
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = stream_file(statement.content, statement.download_name)
+    response['ETag'] = etag
+    return response
 
 
 @enforce_condition(contest_exists & can_enter_contest)
@@ -280,6 +303,7 @@ def my_submissions_view(request):
             'problem_instance__round',
             'problem_instance__problem',
         )
+        .prefetch_related('submissionreport_set__scorereport_set')
     )
     controller = request.contest.controller
     queryset = controller.filter_my_visible_submissions(request, queryset)
@@ -342,9 +366,9 @@ def submission_view(request, submission_id):
     header = controller.render_submission(request, submission)
     footer = controller.render_submission_footer(request, submission)
     reports = []
-    queryset = SubmissionReport.objects.filter(submission=submission).prefetch_related(
-        'scorereport_set'
-    )
+    # Going through the related manager makes report.submission reuse
+    # the already fetched submission instead of querying for it per report.
+    queryset = submission.submissionreport_set.prefetch_related('scorereport_set')
     for report in controller.filter_visible_reports(
         request, submission, queryset.filter(status='ACTIVE')
     ):
@@ -436,13 +460,14 @@ def contest_files_view(request):
             Q(pub_date__isnull=True) | Q(pub_date__lte=request.timestamp)
         )
 
-    round_file_exists = contest_files.filter(round__isnull=False).exists()
-    problem_instances = visible_problem_instances(request)
-    problem_ids = [pi.problem_id for pi in problem_instances]
-    problem_files = ProblemAttachment.objects.filter(
-        problem_id__in=problem_ids
-    ).select_related('problem')
-    add_category_field = round_file_exists or problem_files.exists()
+    contest_files = list(contest_files)
+    round_file_exists = any(cf.round_id is not None for cf in contest_files)
+    problem_files = list(
+        ProblemAttachment.objects.filter(
+            problem_id__in=visible_problem_ids(request)
+        ).select_related('problem')
+    )
+    add_category_field = round_file_exists or bool(problem_files)
     rows = [
         {
             'category': cf.round if cf.round else '',
@@ -511,9 +536,7 @@ def contest_attachment_view(request, attachment_id):
 @enforce_condition(contest_exists & can_enter_contest)
 def problem_attachment_view(request, attachment_id):
     attachment = get_object_or_404(ProblemAttachment, id=attachment_id)
-    problem_instances = visible_problem_instances(request)
-    problem_ids = [pi.problem_id for pi in problem_instances]
-    if attachment.problem_id not in problem_ids:
+    if attachment.problem_id not in visible_problem_ids(request):
         raise PermissionDenied
     return stream_file(attachment.content, attachment.download_name)
 
@@ -86,7 +86,7 @@ def problem_site_statement_zip_view(request, site_key, path):
 
 def check_for_statement(request, problem):
     """Function checking if given problem has a ProblemStatement."""
-    return bool(ProblemStatement.objects.filter(problem=problem))
+    return ProblemStatement.objects.filter(problem=problem).exists()
 
 
 @problem_site_tab(
@@ -127,7 +127,7 @@ def problem_site_statement(request, problem):
 
 def check_for_downloads(request, problem):
     """Function checking if given problem has any downloadables."""
-    return bool(ProblemAttachment.objects.filter(problem=problem)) or bool(
+    return ProblemAttachment.objects.filter(problem=problem).exists() or bool(
         attachment_registry_problemset.to_list(request=request, problem=problem)
     )
 
@@ -127,20 +127,21 @@ def query_statement(problem_id):
     lang_prefs = (
         [translation.get_language()] + ['', None] + [l[0] for l in settings.LANGUAGES]
     )
+    lang_ranks = {}
+    for i, lang in enumerate(lang_prefs):
+        lang_ranks.setdefault(lang, i)
     ext_prefs = ['.zip', '.pdf', '.ps', '.html', '.txt']
+    ext_ranks = {ext: i for i, ext in enumerate(ext_prefs)}
 
     def sort_key(statement):
-        try:
-            lang_pref = lang_prefs.index(statement.language)
-        except ValueError:
-            lang_pref = sys.maxsize
-        try:
-            ext_pref = (ext_prefs.index(statement.extension), '')
-        except ValueError:
+        lang_pref = lang_ranks.get(statement.language, sys.maxsize)
+        if statement.extension in ext_ranks:
+            ext_pref = (ext_ranks[statement.extension], '')
+        else:
             ext_pref = (sys.maxsize, statement.extension)
         return lang_pref, ext_pref
 
-    return sorted(statements, key=sort_key)[0]
+    return min(statements, key=sort_key)
 
 
 def query_zip(statement, path):
@@ -1,3 +1,5 @@
+import os
+
 from django.conf import settings
 from django.contrib import admin, messages
 from django.contrib.admin import SimpleListFilter
@@ -132,19 +134,23 @@ class TestInline(admin.TabularInline):
     def has_view_permission(self, request, obj=None):
         return self.has_change_permission(request, obj)
 
-    def input_file_link(self, instance):
+    def _test_file_link(self, instance, url_name, test_file):
         if instance.id is not None:
-            href = reverse('download_input_file', kwargs={'test_id': str(instance.id)})
-            return make_html_link(href, instance.input_file.name.split('/')[-1])
+            href = reverse(url_name, kwargs={'test_id': instance.id})
+            return make_html_link(href, os.path.basename(test_file.name))
         return None
 
+    def input_file_link(self, instance):
+        return self._test_file_link(
+            instance, 'download_input_file', instance.input_file
+        )
+
     input_file_link.short_description = _("Input file")
 
     def output_file_link(self, instance):
-        if instance.id is not None:
-            href = reverse('download_output_file', kwargs={'test_id': instance.id})
-            return make_html_link(href, instance.output_file.name.split('/')[-1])
-        return None
+        return self._test_file_link(
+            instance, 'download_output_file', instance.output_file
+        )
 
     output_file_link.short_description = _("Output/hint file")
 
@@ -340,8 +346,11 @@ class ProblemPackageAdminMixin(object):
                     problem_instance = ProblemInstance.objects.get(
                         problem=package_instance.problem, contest=contest
                     )
-                if problem_instance.contest and ModelSolution.objects.filter(
-                    problem=problem_instance.problem
+                if (
+                    problem_instance.contest_id
+                    and ModelSolution.objects.filter(
+                        problem_id=problem_instance.problem_id
+                    ).exists()
                 ):
                     models_view = reverse(
                         'model_solutions', args=(problem_instance.id,)
@@ -409,13 +418,17 @@ class ProgramSubmissionAdminMixin(object):
     language_display.short_description = _("Language")
 
     def submission_diff_action(self, request, queryset):
-        if len(queryset) != 2:
+        # Fetching a third id is enough to tell that too many were selected.
+        submission_ids = list(
+            queryset.order_by('date').values_list('id', flat=True)[:3]
+        )
+        if len(submission_ids) != 2:
             messages.error(
                 request, _("You shall select exactly two submissions to diff")
             )
             return None
 
-        id_older, id_newer = [sub.id for sub in queryset.order_by('date')]
+        id_older, id_newer = submission_ids
 
         return redirect(
             'source_diff',
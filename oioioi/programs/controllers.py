@@ -855,18 +855,19 @@ class ProgrammingProblemController(ProblemController):
         elif not request.contest and not is_contest_basicadmin(request):
             pc = submission.problem_instance.controller
             queryset = pc.filter_my_visible_submissions(request, queryset)
-        show_scores = bool(queryset.filter(score__isnull=False))
+        submissions = list(queryset)
+        if not submissions:
+            return super_footer
 
+        show_scores = any(s.score is not None for s in submissions)
         can_admin = can_admin_problem_instance(request, submission.problem_instance)
 
-        if not queryset.exists():
-            return super_footer
         return super_footer + render_to_string(
             'programs/other_submissions.html',
             request=request,
             context={
                 'submissions': [
-                    submission_template_context(request, s) for s in queryset
+                    submission_template_context(request, s) for s in submissions
                 ],
                 'show_scores': show_scores,
                 'can_admin': can_admin,
@@ -5,7 +5,8 @@ from oioioi.base.tests import TestCase
 from oioioi.contests.models import Contest
 from oioioi.contests.tests import make_empty_contest_formset
 from oioioi.contests.tests.utils import make_user_contest_admin
-from oioioi.teachers.models import Teacher
+from oioioi.participants.models import Participant
+from oioioi.teachers.models import ContestTeacher, Teacher
 
 
 def change_contest_type(contest):
@@ -181,3 +182,52 @@ class TestAdminTeacher(TestCase):
         self.assertEqual(Teacher.objects.all().count(), 2)
         mod_teacher = Teacher.objects.get(pk=1001)
         self.assertEqual(mod_teacher.school, "New School")
+
+
+class TestBulkAddMembers(TestCase):
+    fixtures = ['test_users', 'teachers', 'test_contest']
+
+    def test_bulk_add_members(self):
+        contest = Contest.objects.get(id='c')
+        change_contest_type(contest)
+        other_contest = Contest.objects.create(
+            id='c2',
+            name='Other contest',
+            controller_name='oioioi.teachers.controllers.TeacherContestController',
+        )
+        teacher = Teacher.objects.get(user__username='test_user')
+        other_teacher = Teacher.objects.get(user__username='test_user2')
+        ContestTeacher.objects.create(contest=contest, teacher=teacher)
+        ContestTeacher.objects.create(contest=other_contest, teacher=teacher)
+        ContestTeacher.objects.create(contest=other_contest, teacher=other_teacher)
+
+        user2 = User.objects.get(username='test_user2')
+        user3 = User.objects.get(username='test_user3')
+        Participant.objects.create(contest=contest, user=user3)
+        Participant.objects.create(contest=other_contest, user=user2)
+        Participant.objects.create(contest=other_contest, user=user3)
+
+        self.assertTrue(self.client.login(username='test_user'))
+        url = reverse(
+            'teachers_bulk_add_members',
+            kwargs={'contest_id': contest.id, 'other_contest_id': other_contest.id},
+        )
+        response = self.client.post(url)
+        self.assertEqual(response.status_code, 302)
+
+        self.assertEqual(
+            set(
+                Participant.objects.filter(contest=contest).values_list(
+                    'user__username', flat=True
+                )
+            ),
+            {'test_user2', 'test_user3'},
+        )
+        self.assertEqual(
+            set(
+                ContestTeacher.objects.filter(contest=contest).values_list(
+                    'teacher__user__username', flat=True
+                )
+            ),
+            {'test_user', 'test_user2'},
+        )
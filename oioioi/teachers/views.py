@@ -57,6 +57,14 @@ def get_non_teacher_names(request):
     queryset = User.objects.filter(teacher__isnull=True)
     return get_user_hints_view(request, 'substr', queryset)
 
+
+def _render_email(subject_template_name, body_template_name, context):
+    subject = render_to_string(subject_template_name, context)
+    subject = ' '.join(subject.strip().splitlines())
+    body = render_to_string(body_template_name, context)
+    return subject, body
+
+
 def send_request_email(request, teacher, message):
     context = {
         'teacher': teacher,
@@ -65,9 +73,9 @@ def send_request_email(request, teacher, message):
         ),
         'message': message.strip(),
     }
-    subject = render_to_string('teachers/request_email_subject.txt', context)
-    subject = ' '.join(subject.strip().splitlines())
-    body = render_to_string('teachers/request_email.txt', context)
+    subject, body = _render_email(
+        'teachers/request_email_subject.txt', 'teachers/request_email.txt', context
+    )
     message = EmailMessage(
         subject,
         body,
@@ -85,9 +93,11 @@ def send_acceptance_email(request, teacher):
             reverse('oioioiadmin:contests_contest_add')
         ),
     }
-    subject = render_to_string('teachers/acceptance_email_subject.txt', context)
-    subject = ' '.join(subject.strip().splitlines())
-    body = render_to_string('teachers/acceptance_email.txt', context)
+    subject, body = _render_email(
+        'teachers/acceptance_email_subject.txt',
+        'teachers/acceptance_email.txt',
+        context,
+    )
     teacher.user.email_user(subject, body)
 
 
@@ -168,6 +178,7 @@ def members_view(request, member_type):
         is_registration_active = registration_config.is_active_pupil
     else:
         raise Http404
+    members = list(members.only('id', 'username', 'first_name', 'last_name'))
 
     registration_link = request.build_absolute_uri(
         reverse(
@@ -175,9 +186,11 @@ def members_view(request, member_type):
             kwargs={'contest_id': request.contest.id, 'key': key},
         )
     )
-    other_contests = Contest.objects.filter(
-        contestteacher__teacher__user=request.user
-    ).exclude(id=request.contest.id)
+    other_contests = list(
+        Contest.objects.filter(contestteacher__teacher__user=request.user)
+        .exclude(id=request.contest.id)
+        .only('id', 'name')
+    )
 
     context = {
         'member_type': member_type,
@@ -227,7 +240,8 @@ def activate_view(request, key):
         else:
             raise Http404
 
-    if not request.method == 'POST' or 'register_as' not in request.POST:
+    register_as = request.POST.get('register_as')
+    if not request.method == 'POST' or register_as is None:
         return TemplateResponse(
             request,
             'teachers/confirm_join.html',
@@ -238,7 +252,6 @@ def activate_view(request, key):
             },
         )
     else:
-        register_as = request.POST['register_as']
         created = True
         if register_as == 'pupil':
             _p, created = Participant.objects.get_or_create(
@@ -324,12 +337,22 @@ def bulk_add_members_view(request, other_contest_id):
     other_contest = get_object_or_404(Contest, id=other_contest_id)
     if not request.user.has_perm('contests.contest_admin', other_contest):
         raise PermissionDenied
-    for p in Participant.objects.filter(contest=other_contest):
-        Participant.objects.get_or_create(contest=request.contest, user=p.user)
-    for ct in ContestTeacher.objects.filter(contest=other_contest):
-        ContestTeacher.objects.get_or_create(
-            contest=request.contest, teacher=ct.teacher
-        )
+    user_ids = (
+        Participant.objects.filter(contest=other_contest)
+        .exclude(user__participant__contest=request.contest)
+        .values_list('user_id', flat=True)
+    )
+    Participant.objects.bulk_create(
+        [Participant(contest=request.contest, user_id=uid) for uid in user_ids]
+    )
+    teacher_ids = (
+        ContestTeacher.objects.filter(contest=other_contest)
+        .exclude(teacher__contestteacher__contest=request.contest)
+        .values_list('teacher_id', flat=True)
+    )
+    ContestTeacher.objects.bulk_create(
+        [ContestTeacher(contest=request.contest, teacher_id=tid) for tid in teacher_ids]
+    )
 
     messages.info(request, _("Import members completed successfully."))
     return redirect('contest_dashboard', contest_id=request.contest.id)